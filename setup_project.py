@@ -1,15 +1,100 @@
 import os
 import json
-import pandas as pd
-from datetime import datetime, timedelta
-import random
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+# ISO 8601 layout of the timestamp column in sample_data.csv
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# Contents of every generated __init__.py
+INIT_FILE_CONTENT = b'"""AIOptima package"""\n'
+
+# Shared layout of the generated startup scripts
+STARTUP_SCRIPT_TEMPLATE = """#!/bin/bash
+echo "{banner}"
+{body}"""
+
+# AI Providers and their models
+PROVIDERS_DATA = {
+    'OpenAI': {
+        'models': ['gpt-4', 'gpt-4-turbo', 'gpt-3.5-turbo', 'gpt-3.5-turbo-16k'],
+        'cost_input': 0.00001,
+        'cost_output': 0.00003,
+        'energy_factor': 1.0
+    },
+    'Anthropic': {
+        'models': ['claude-3-opus', 'claude-3-sonnet', 'claude-3-haiku', 'claude-instant'],
+        'cost_input': 0.000015,
+        'cost_output': 0.000075,
+        'energy_factor': 1.2
+    },
+    'Google': {
+        'models': ['gemini-pro', 'gemini-pro-vision', 'palm-2', 'codey'],
+        'cost_input': 0.0000125,
+        'cost_output': 0.0000375,
+        'energy_factor': 0.8
+    },
+    'Cohere': {
+        'models': ['command', 'command-light', 'embed-english', 'embed-multilingual'],
+        'cost_input': 0.000001,
+        'cost_output': 0.000002,
+        'energy_factor': 0.6
+    }
+}
+
+# Lookup tables for vectorized sampling, built once instead of per drawn row
+PROVIDER_NAMES = tuple(PROVIDERS_DATA)
+MODELS = tuple(tuple(PROVIDERS_DATA[provider]['models']) for provider in PROVIDER_NAMES)
+# Models that respond noticeably slower than the rest
+HEAVY_MODELS = tuple(
+    tuple(('gpt-4' in model or 'claude-3-opus' in model) for model in models)
+    for models in MODELS
+)
+
+# Column layout shared by the base sample and every usage scenario
+COLUMN_DTYPES = {
+    'provider_name': 'object',
+    'model_name': 'object',
+    'input_tokens': 'int32',
+    'output_tokens': 'int32',
+    'response_time': 'float64',
+    'timestamp': 'datetime64[ns]'
+}
+
+# Extra traffic mixed into the burst and cost-focused scenarios
+USAGE_PROFILES = {
+    # Heavy models during bursts, with larger requests and slower responses
+    'burst': {
+        'providers': ['OpenAI', 'Anthropic'],
+        'models': ['gpt-4', 'claude-3-opus'],
+        'input_tokens': (500, 3000),
+        'output_tokens': (200, 1500),
+        'response_time': (2.0, 8.0)
+    },
+    # Heavy GPT-4 usage (most expensive)
+    'expensive': {
+        'providers': ['OpenAI'],
+        'models': ['gpt-4'],
+        'input_tokens': (1000, 4000),
+        'output_tokens': (500, 2000),
+        'response_time': (3.0, 10.0)
+    },
+    # Cheap, fast models
+    'efficient': {
+        'providers': ['Google', 'Cohere'],
+        'models': ['gemini-pro', 'command-light'],
+        'input_tokens': (100, 800),
+        'output_tokens': (50, 300),
+        'response_time': (0.5, 2.0)
+    }
+}
 
 def create_project_structure():
     """Create the complete project directory structure"""
     
+    # Only leaf directories - makedirs creates "aioptima" and "aioptima/backend" on the way
     directories = [
-        "aioptima",
-        "aioptima/backend",
         "aioptima/backend/models",
         "aioptima/backend/api",
         "aioptima/backend/services",
@@ -35,187 +120,203 @@ def create_project_structure():
         "aioptima/tests/__init__.py"
     ]
     
+    # Raw fds skip the buffered file object for these tiny one-shot writes
     for init_file in init_files:
-        with open(init_file, 'w') as f:
-            f.write('"""AIOptima package"""\n')
+        fd = os.open(init_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, INIT_FILE_CONTENT)
+        finally:
+            os.close(fd)
         print(f"✅ Created: {init_file}")
 
 def generate_sample_data():
     """Generate comprehensive sample data for testing"""
+    # Imported here so the scaffolding steps run without pandas/numpy/pyarrow installed
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    from datetime import datetime, timedelta
+    
+    # Generate sample API usage data
+    rng = np.random.default_rng()
+    start_date = pd.Timestamp(datetime.now() - timedelta(days=30)).normalize()
+    
+    # Generate 5-50 calls per day with realistic patterns
+    daily_calls = rng.integers(5, 51, size=30)
+    num_calls = int(daily_calls.sum())
+    day_offsets = np.repeat(np.arange(30), daily_calls)
     
-    # AI Providers and their models
-    providers_data = {
-        'OpenAI': {
-            'models': ['gpt-4', 'gpt-4-turbo', 'gpt-3.5-turbo', 'gpt-3.5-turbo-16k'],
-            'cost_input': 0.00001,
-            'cost_output': 0.00003,
-            'energy_factor': 1.0
-        },
-        'Anthropic': {
-            'models': ['claude-3-opus', 'claude-3-sonnet', 'claude-3-haiku', 'claude-instant'],
-            'cost_input': 0.000015,
-            'cost_output': 0.000075,
-            'energy_factor': 1.2
-        },
-        'Google': {
-            'models': ['gemini-pro', 'gemini-pro-vision', 'palm-2', 'codey'],
-            'cost_input': 0.0000125,
-            'cost_output': 0.0000375,
-            'energy_factor': 0.8
-        },
-        'Cohere': {
-            'models': ['command', 'command-light', 'embed-english', 'embed-multilingual'],
-            'cost_input': 0.000001,
-            'cost_output': 0.000002,
-            'energy_factor': 0.6
-        }
+    # Bias towards business hours (9 AM - 6 PM)
+    hour_weights = np.array(
+        [1, 1, 1, 1, 1, 1, 2, 4, 6, 8, 8, 8, 8, 8, 8, 8, 8, 6, 4, 2, 1, 1, 1, 1],
+        dtype=float
+    )
+    hours = rng.choice(24, size=num_calls, p=hour_weights / hour_weights.sum())
+    minutes = rng.integers(0, 60, size=num_calls)
+    seconds = rng.integers(0, 60, size=num_calls)
+    
+    timestamps = (
+        start_date
+        + pd.to_timedelta(day_offsets, unit='D')
+        + pd.to_timedelta(hours, unit='h')
+        + pd.to_timedelta(minutes, unit='m')
+        + pd.to_timedelta(seconds, unit='s')
+    )
+    
+    # Select provider and model
+    provider_names = np.array(PROVIDER_NAMES)
+    provider_idx = rng.integers(0, len(provider_names), size=num_calls)
+    models = np.empty(num_calls, dtype=object)
+    heavy_model = np.empty(num_calls, dtype=bool)
+    for idx, (provider_models, provider_heavy) in enumerate(zip(MODELS, HEAVY_MODELS)):
+        rows = np.flatnonzero(provider_idx == idx)
+        model_idx = rng.integers(0, len(provider_models), size=rows.size)
+        models[rows] = np.array(provider_models)[model_idx]
+        heavy_model[rows] = np.array(provider_heavy)[model_idx]
+    
+    # Response time varies by provider and model complexity
+    base_response_time = rng.uniform(0.5, 3.0, size=num_calls)
+    response_time = np.where(
+        heavy_model,
+        base_response_time * rng.uniform(1.5, 2.5, size=num_calls),
+        base_response_time * rng.uniform(0.8, 1.2, size=num_calls)
+    )
+    
+    base_rows = {
+        'provider_name': provider_names[provider_idx],
+        'model_name': models,
+        # Generate realistic token usage
+        'input_tokens': rng.integers(50, 2001, size=num_calls, dtype=np.int32),
+        'output_tokens': rng.integers(20, 801, size=num_calls, dtype=np.int32),
+        'response_time': response_time.round(2),
+        'timestamp': timestamps
     }
     
-    # Generate sample API usage data
-    sample_data = []
-    start_date = datetime.now() - timedelta(days=30)
-    
-    for day in range(30):
-        current_date = start_date + timedelta(days=day)
-        
-        # Generate 5-50 calls per day with realistic patterns
-        daily_calls = random.randint(5, 50)
-        
-        # More calls during business hours
-        for _ in range(daily_calls):
-            # Bias towards business hours (9 AM - 6 PM)
-            hour = random.choices(
-                range(24),
-                weights=[1, 1, 1, 1, 1, 1, 2, 4, 6, 8, 8, 8, 8, 8, 8, 8, 8, 6, 4, 2, 1, 1, 1, 1]
-            )[0]
-            
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            
-            timestamp = current_date.replace(hour=hour, minute=minute, second=second)
-            
-            # Select provider and model
-            provider = random.choice(list(providers_data.keys()))
-            model = random.choice(providers_data[provider]['models'])
-            
-            # Generate realistic token usage
-            input_tokens = random.randint(50, 2000)
-            output_tokens = random.randint(20, 800)
-            
-            # Response time varies by provider and model complexity
-            base_response_time = random.uniform(0.5, 3.0)
-            if 'gpt-4' in model or 'claude-3-opus' in model:
-                response_time = base_response_time * random.uniform(1.5, 2.5)
-            else:
-                response_time = base_response_time * random.uniform(0.8, 1.2)
-            
-            sample_data.append({
-                'provider_name': provider,
-                'model_name': model,
-                'input_tokens': input_tokens,
-                'output_tokens': output_tokens,
-                'response_time': round(response_time, 2),
-                'timestamp': timestamp.isoformat()
-            })
-    
-    # Save sample data
-    sample_df = pd.DataFrame(sample_data)
-    sample_df.to_csv('aioptima/database/sample_data.csv', index=False)
-    print(f"✅ Generated {len(sample_data)} sample API calls")
-    
-    # Generate different usage scenarios
+    # Lay out [burst extra | base | cost extra] in one set of column arrays so
+    # every scenario below is a row selection instead of a concat copy
+    sections = [generate_burst_pattern(rng), base_rows, generate_cost_focused_data(rng)]
+    bounds = np.cumsum([0] + [len(section['timestamp']) for section in sections])
+    columns = {}
+    for column, dtype in COLUMN_DTYPES.items():
+        columns[column] = np.empty(bounds[-1], dtype=dtype)
+        for section, start, stop in zip(sections, bounds[:-1], bounds[1:]):
+            columns[column][start:stop] = section[column]
+    all_rows = pd.DataFrame(columns)
+    base_start, base_stop = bounds[1], bounds[2]
+    
+    # Save sample data with Arrow's CSV writer, formatting the timestamps first
+    sample_df = all_rows.iloc[base_start:base_stop].reset_index(drop=True)
+    sample_table = pa.Table.from_pandas(sample_df, preserve_index=False)
+    timestamp_idx = sample_table.schema.get_field_index('timestamp')
+    sample_table = sample_table.set_column(
+        timestamp_idx,
+        'timestamp',
+        pc.strftime(
+            sample_table['timestamp'].cast(pa.timestamp('s'), safe=False),
+            format=TIMESTAMP_FORMAT
+        )
+    )
+    pacsv.write_csv(
+        sample_table,
+        'aioptima/database/sample_data.csv',
+        write_options=pacsv.WriteOptions(batch_size=65536)
+    )
+    print(f"✅ Generated {len(sample_df)} sample API calls")
+    
+    # Generate different usage scenarios as row selections into all_rows,
+    # applied by write_scenario
     scenarios = {
-        'heavy_usage': sample_df.sample(frac=2, replace=True),  # 2x the data
-        'light_usage': sample_df.sample(frac=0.3),  # 30% of the data
-        'burst_usage': generate_burst_pattern(sample_df),
-        'cost_focused': generate_cost_focused_data(sample_df, providers_data)
+        'heavy_usage': base_start + rng.integers(0, num_calls, size=2 * num_calls),  # 2x the data
+        'light_usage': base_start + rng.choice(num_calls, size=round(0.3 * num_calls), replace=False),  # 30% of the data
+        'burst_usage': np.r_[base_start:base_stop, 0:base_start],  # base rows first, then the bursts
+        'cost_focused': slice(base_start, None)
     }
     
-    for scenario_name, scenario_data in scenarios.items():
-        scenario_data.to_csv(f'aioptima/database/{scenario_name}_sample.csv', index=False)
-        print(f"✅ Generated {scenario_name} scenario with {len(scenario_data)} records")
+    # The writes are independent and pyarrow releases the GIL, so overlap them
+    with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+        written = executor.map(write_scenario, scenarios.keys(), repeat(all_rows), scenarios.values())
+        for scenario_name, num_records in written:
+            print(f"✅ Generated {scenario_name} scenario with {num_records} records")
     
     return sample_df
 
-def generate_burst_pattern(base_df):
-    """Generate data with burst usage patterns"""
-    burst_data = base_df.copy()
+def write_scenario(scenario_name, rows_df, rows):
+    """Write the rows of rows_df selected by rows as one usage scenario"""
+    scenario_data = rows_df.iloc[rows]
     
-    # Add burst periods (5x normal usage for 2-hour windows)
-    burst_times = pd.date_range(
-        start=datetime.now() - timedelta(days=30),
-        end=datetime.now(),
-        freq='3D'  # Every 3 days
+    # Parquet (needs pyarrow) is much faster to write and read back than CSV
+    scenario_data.to_parquet(
+        f'aioptima/database/{scenario_name}_sample.parquet',
+        index=False,
+        compression='snappy'
     )
+    return scenario_name, len(scenario_data)
+
+def _draw_rows(n, rng, profile):
+    """Draw n rows of every column except timestamp for a usage profile"""
+    import numpy as np
     
-    additional_data = []
-    for burst_time in burst_times:
-        burst_end = burst_time + timedelta(hours=2)
-        
-        # Generate 5x more calls during burst
-        for _ in range(random.randint(50, 100)):
-            timestamp = burst_time + timedelta(
-                minutes=random.randint(0, 120)
-            )
-            
-            provider = random.choice(['OpenAI', 'Anthropic'])
-            model = random.choice(['gpt-4', 'claude-3-opus'])  # Heavy models during bursts
-            
-            additional_data.append({
-                'provider_name': provider,
-                'model_name': model,
-                'input_tokens': random.randint(500, 3000),  # Larger requests
-                'output_tokens': random.randint(200, 1500),
-                'response_time': round(random.uniform(2.0, 8.0), 2),  # Slower responses
-                'timestamp': timestamp.isoformat()
-            })
-    
-    burst_df = pd.DataFrame(additional_data)
-    return pd.concat([burst_data, burst_df], ignore_index=True)
-
-def generate_cost_focused_data(base_df, providers_data):
-    """Generate data focusing on cost optimization scenarios"""
-    cost_data = base_df.copy()
-    
-    # Add expensive usage patterns
-    expensive_data = []
+    spec = USAGE_PROFILES[profile]
+    providers = np.array(spec['providers'])
+    models = np.array(spec['models'])
+    input_low, input_high = spec['input_tokens']
+    output_low, output_high = spec['output_tokens']
     
-    # Heavy GPT-4 usage (most expensive)
-    for _ in range(200):
-        timestamp = datetime.now() - timedelta(
-            days=random.randint(1, 30),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
-        )
-        
-        expensive_data.append({
-            'provider_name': 'OpenAI',
-            'model_name': 'gpt-4',
-            'input_tokens': random.randint(1000, 4000),  # Large inputs
-            'output_tokens': random.randint(500, 2000),   # Large outputs
-            'response_time': round(random.uniform(3.0, 10.0), 2),
-            'timestamp': timestamp.isoformat()
-        })
-    
-    # Mix in some efficient usage
-    for _ in range(300):
-        timestamp = datetime.now() - timedelta(
-            days=random.randint(1, 30),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
-        )
-        
-        expensive_data.append({
-            'provider_name': random.choice(['Google', 'Cohere']),
-            'model_name': random.choice(['gemini-pro', 'command-light']),
-            'input_tokens': random.randint(100, 800),
-            'output_tokens': random.randint(50, 300),
-            'response_time': round(random.uniform(0.5, 2.0), 2),
-            'timestamp': timestamp.isoformat()
-        })
-    
-    cost_df = pd.DataFrame(expensive_data)
-    return pd.concat([cost_data, cost_df], ignore_index=True)
+    return {
+        'provider_name': providers[rng.integers(0, len(providers), size=n)],
+        'model_name': models[rng.integers(0, len(models), size=n)],
+        'input_tokens': rng.integers(input_low, input_high + 1, size=n, dtype=np.int32),
+        'output_tokens': rng.integers(output_low, output_high + 1, size=n, dtype=np.int32),
+        'response_time': rng.uniform(*spec['response_time'], size=n).round(2)
+    }
+
+def generate_burst_pattern(rng):
+    """Generate the extra rows of the burst usage pattern"""
+    import numpy as np
+    from datetime import datetime, timedelta
+    
+    # Add burst periods (5x normal usage for 2-hour windows) every 3 days
+    burst_starts = (
+        np.datetime64(datetime.now() - timedelta(days=30), 's')
+        + np.arange(0, 31, 3).astype('timedelta64[D]')
+    )
+    
+    # Generate 5x more calls during burst
+    burst_counts = rng.integers(50, 101, size=len(burst_starts))
+    num_calls = int(burst_counts.sum())
+    
+    rows = _draw_rows(num_calls, rng, 'burst')
+    rows['timestamp'] = (
+        np.repeat(burst_starts, burst_counts)
+        + rng.integers(0, 2 * 60 * 60 + 1, size=num_calls).astype('timedelta64[s]')
+    )
+    return rows
+
+def _random_recent_timestamps(rng, size):
+    """Draw timestamps 1-30 days, 0-23 hours and 0-59 minutes before now"""
+    import numpy as np
+    from datetime import datetime
+    
+    return (
+        np.datetime64(datetime.now(), 's')
+        - rng.integers(1, 31, size=size).astype('timedelta64[D]')
+        - rng.integers(0, 24, size=size).astype('timedelta64[h]')
+        - rng.integers(0, 60, size=size).astype('timedelta64[m]')
+    )
+
+def generate_cost_focused_data(rng):
+    """Generate the extra rows of the cost optimization scenario"""
+    import numpy as np
+    
+    # Heavy GPT-4 usage (most expensive) mixed with some efficient usage
+    expensive = _draw_rows(200, rng, 'expensive')
+    efficient = _draw_rows(300, rng, 'efficient')
+    
+    rows = {column: np.concatenate([expensive[column], efficient[column]]) for column in expensive}
+    rows['timestamp'] = _random_recent_timestamps(rng, 500)
+    return rows
 
 def create_config_files():
     """Create configuration files"""
@@ -295,37 +396,19 @@ services:
 def create_startup_scripts():
     """Create startup scripts for easy development"""
     
-    # Start backend script
-    start_backend = """#!/bin/bash
-echo "🚀 Starting AIOptima Backend..."
-cd backend
-python -m uvicorn main:app --reload --host 0.0.0.0 --port 8000
-"""
-    
-    with open('aioptima/start_backend.sh', 'w') as f:
-        f.write(start_backend)
-    os.chmod('aioptima/start_backend.sh', 0o755)
-    print("✅ Created start_backend.sh")
+    backend_command = "python -m uvicorn main:app --reload --host 0.0.0.0 --port 8000"
+    dashboard_command = "streamlit run dashboard.py --server.port 8501"
     
-    # Start dashboard script
-    start_dashboard = """#!/bin/bash
-echo "📊 Starting AIOptima Dashboard..."
-cd frontend
-streamlit run dashboard.py --server.port 8501
-"""
-    
-    with open('aioptima/start_dashboard.sh', 'w') as f:
-        f.write(start_dashboard)
-    os.chmod('aioptima/start_dashboard.sh', 0o755)
-    print("✅ Created start_dashboard.sh")
-    
-    # Combined startup script
-    start_all = """#!/bin/bash
-echo "🤖 Starting AIOptima Complete System..."
-
+    scripts = {
+        # Start backend script
+        'start_backend.sh': ("🚀 Starting AIOptima Backend...", f"cd backend\n{backend_command}\n"),
+        # Start dashboard script
+        'start_dashboard.sh': ("📊 Starting AIOptima Dashboard...", f"cd frontend\n{dashboard_command}\n"),
+        # Combined startup script
+        'start_all.sh': ("🤖 Starting AIOptima Complete System...", f"""
 # Start backend in background
 echo "Starting backend..."
-cd backend && python -m uvicorn main:app --reload --host 0.0.0.0 --port 8000 &
+cd backend && {backend_command} &
 BACKEND_PID=$!
 
 # Wait a moment for backend to start
@@ -333,7 +416,7 @@ sleep 5
 
 # Start dashboard
 echo "Starting dashboard..."
-cd ../frontend && streamlit run dashboard.py --server.port 8501 &
+cd ../frontend && {dashboard_command} &
 DASHBOARD_PID=$!
 
 echo "✅ AIOptima is running!"
@@ -345,12 +428,14 @@ echo "Press Ctrl+C to stop all services"
 # Wait for interrupt
 trap "kill $BACKEND_PID $DASHBOARD_PID; exit" INT
 wait
-"""
+""")
+    }
     
-    with open('aioptima/start_all.sh', 'w') as f:
-        f.write(start_all)
-    os.chmod('aioptima/start_all.sh', 0o755)
-    print("✅ Created start_all.sh")
+    for script_name, (banner, body) in scripts.items():
+        script_path = Path('aioptima') / script_name
+        script_path.write_text(STARTUP_SCRIPT_TEMPLATE.format(banner=banner, body=body), newline='\n')
+        script_path.chmod(0o755)
+        print(f"✅ Created {script_name}")
 
 def create_documentation():
     """Create project documentation"""